@@ -25,6 +25,10 @@ import time
 import json
 import subprocess
 import shutil
+import atexit
+import traceback
+from functools import lru_cache
+from types import MappingProxyType
 from queue import Queue, Empty
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
@@ -32,12 +36,12 @@ from urllib.error import URLError, HTTPError
 # PyQt5 imports
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QComboBox, QPushButton, QTextEdit, QDateEdit,
+    QLabel, QLineEdit, QComboBox, QPushButton, QTextEdit, QPlainTextEdit, QDateEdit,
     QCheckBox, QGroupBox, QTabWidget, QFrame, QMessageBox, QDialog,
     QFormLayout, QSpacerItem, QSizePolicy, QMenu, QAction, QToolButton,
     QTableWidget, QTableWidgetItem
 )
-from PyQt5.QtCore import Qt, QDate, QTimer, pyqtSignal, QObject, QThread, QPropertyAnimation, QPointF, QRectF, QEasingCurve
+from PyQt5.QtCore import Qt, QDate, QTimer, pyqtSignal, pyqtSlot, QObject, QThread, QPropertyAnimation, QPointF, QRect, QRectF, QLineF, QEasingCurve, QStringListModel
 from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QPixmap, QPainter, QPen, QBrush, QPainterPath, QRadialGradient, QLinearGradient
 from PyQt5.QtWidgets import QSplashScreen, QProgressBar
 import math
@@ -63,6 +67,8 @@ else:
 
 ICON_PATH = os.path.join(BASE_PATH, 'myicon.ico')
 ICON_PNG_PATH = os.path.join(BASE_PATH, 'myicon.png')
+# The first icon file present, checked once at startup (None when neither is bundled)
+APP_ICON_PATH = next((path for path in (ICON_PNG_PATH, ICON_PATH) if os.path.exists(path)), None)
 
 # Portable mode detection - check for portable.txt in exe directory
 PORTABLE_MODE = os.path.exists(os.path.join(EXE_DIR, 'portable.txt'))
@@ -92,11 +98,49 @@ UPDATE_CHECK_INTERVAL = 86400  # Check once per day (seconds)
 # Constants
 LOG_BUFFER_SIZE = 10
 MAX_LOG_LINES = 1000
+PROGRESS_LOG_INTERVAL = 0.5  # Minimum seconds between worker progress log lines
+FORWARD_LOG_BATCH_SIZE = 10  # Max forwarded emails buffered before writing when there is no delay
+SEARCH_PREVIEW_CHARS = 2000  # Characters of matching emails shown in the search results dialog
 DEFAULT_TIMEZONE = 'US/Eastern'
-
-# Thread lock for database access
+LOCAL_TZ = pytz.timezone(DEFAULT_TIMEZONE)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+QDATE_FORMAT = "MM/dd/yyyy"  # Qt format of the date pickers and the saved last-used dates
+# Order matches the row.GetValues() unpacking in the worker; the proptag is PR_HASATTACH
+TABLE_COLUMNS = ("EntryID", "Subject", "SentOn", "MessageClass",
+                 "http://schemas.microsoft.com/mapi/proptag/0x0E1B000B")
+SUBJECT_FILTER_TEMPLATE = "\"urn:schemas:httpmail:subject\" ci_phrasematch '{keyword}'"
+# PR_CLIENT_SUBMIT_TIME is the property behind SentOn; DASL compares it in UTC
+SENT_ON_PROPTAG = "http://schemas.microsoft.com/mapi/proptag/0x00390040"
+SENT_ON_FILTER_TEMPLATE = f"\"{SENT_ON_PROPTAG}\" >= '{{start}}' AND \"{SENT_ON_PROPTAG}\" < '{{end}}'"
+DASL_DATE_FORMAT = "%m/%d/%Y %I:%M %p"
+# PR_MESSAGE_CLASS; mail items (olMail) are IPM.Note and its IPM.Note.* variants
+MAIL_CLASS_FILTER = "\"http://schemas.microsoft.com/mapi/proptag/0x001A001F\" LIKE 'IPM.Note%'"
+HAS_ATTACHMENT_FILTER = "\"urn:schemas:httpmail:hasattachment\" = 1"
+
+# Thread lock serializing database writes
 db_lock = threading.Lock()
 
+# error.log is opened once and kept open instead of reopened for every line
+_error_log_file = None
+_error_log_lock = threading.Lock()
+
+
+def write_error_log(message, include_traceback=False):
+    """Append a timestamped line (and optionally the current traceback) to error.log."""
+    global _error_log_file
+    try:
+        with _error_log_lock:
+            if _error_log_file is None:
+                _error_log_file = open(os.path.join(get_app_data_dir(), 'error.log'), 'a',
+                                       encoding='utf-8', buffering=1)
+                atexit.register(_error_log_file.close)
+            _error_log_file.write(f"[{time.strftime(TIMESTAMP_FORMAT)}] {message}\n")
+            if include_traceback:
+                _error_log_file.write(traceback.format_exc())
+                _error_log_file.write("\n")
+    except Exception:
+        pass
+
 # Database path in app data folder (portable or installed)
 def get_db_path():
     """Get the path to the database file."""
@@ -106,18 +150,14 @@ def get_db_path():
         return db_path
     except Exception as e:
         # Log error and fallback to current directory
-        try:
-            error_log = os.path.join(get_app_data_dir(), 'error.log')
-            with open(error_log, 'a') as f:
-                f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] get_db_path error: {e}\n")
-        except:
-            pass
+        write_error_log(f"get_db_path error: {e}")
         return 'docushuttle.db'
 
 # ============================================================================
 # STYLE CONSTANTS - OCRMill Light Theme
 # ============================================================================
-COLORS = {
+# Read-only so the cached stylesheets can't drift from the palette
+COLORS = MappingProxyType({
     'primary': '#5D9A96',           # Muted teal accent
     'primary_hover': '#4A7B78',     # Darker muted teal for hover
     'primary_light': '#7FB3AF',     # Lighter muted teal for highlights
@@ -134,9 +174,13 @@ COLORS = {
     'warning': '#D4A056',           # Muted orange for warning
     'tab_inactive': '#F5F5F5',      # Very light gray for inactive tabs
     'status_bar_bg': '#F0F0F0',     # Status bar background
-}
+})
+
 
-STYLESHEET = f"""
+@lru_cache(maxsize=None)
+def build_stylesheet():
+    """Build the application stylesheet on first use; later calls return the same string."""
+    return f"""
 QMainWindow {{
     background-color: {COLORS['bg']};
 }}
@@ -298,7 +342,7 @@ QPushButton#secondaryButton:hover {{
 }}
 
 /* TextEdit styling */
-QTextEdit {{
+QTextEdit, QPlainTextEdit {{
     border: 1px solid {COLORS['input_border']};
     border-radius: 4px;
     background-color: {COLORS['input_bg']};
@@ -310,14 +354,30 @@ QTextEdit {{
 QToolButton#menuButton {{
     background-color: transparent;
     border: 1px solid {COLORS['border']};
-    border-radius: 3px;
+    border-radius: 4px;
     color: {COLORS['text']};
-    font-size: 14pt;
-    padding: 6px;
+    font-size: 16pt;
 }}
 
 QToolButton#menuButton:hover {{
     background-color: #E8E8E8;
+    border: 1px solid {COLORS['border']};
+}}
+
+/* Popup menus */
+QMenu#popupMenu {{
+    background-color: {COLORS['frame_bg']};
+    border: 1px solid {COLORS['border']};
+    padding: 5px;
+}}
+
+QMenu#popupMenu::item {{
+    padding: 8px 20px;
+}}
+
+QMenu#popupMenu::item:selected {{
+    background-color: {COLORS['primary']};
+    color: white;
 }}
 
 /* Label styling */
@@ -350,6 +410,20 @@ QCheckBox::indicator:checked {{
 """
 
 
+@lru_cache(maxsize=None)
+def get_app_icon():
+    """Load the window icon on first use; None when neither icon file exists."""
+    return QIcon(APP_ICON_PATH) if APP_ICON_PATH else None
+
+
+@lru_cache(maxsize=None)
+def get_logo_pixmap():
+    """Load and scale the header logo on first use; None when myicon.png is missing."""
+    if APP_ICON_PATH == ICON_PNG_PATH:
+        return QPixmap(ICON_PNG_PATH).scaled(36, 36, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return None
+
+
 # ============================================================================
 # AUTO-UPDATE SYSTEM
 # ============================================================================
@@ -561,32 +635,77 @@ class WorkerSignals(QObject):
     log_message = pyqtSignal(str)
     display_subject = pyqtSignal(str, str, str)  # subject, recipient, attachments
     operation_complete = pyqtSignal(int, int)
-    search_complete = pyqtSignal(int, list)
+    search_complete = pyqtSignal(int, int, list)  # scanned, matched, preview lines
+    error = pyqtSignal(str)
+    task_finished = pyqtSignal()
+
+
+class DatabaseLoadSignals(QObject):
+    """Signals for the startup database thread."""
+    loaded = pyqtSignal(list)  # recipient email addresses
     error = pyqtSignal(str)
-    clear_subjects = pyqtSignal()
 
 
 # ============================================================================
 # DATABASE FUNCTIONS
 # ============================================================================
+# One long-lived connection per thread. Under WAL, readers never block the writer,
+# so only writes take db_lock.
+_db_local = threading.local()
+
+
+def get_db():
+    """Return this thread's database connection, opening it on first use."""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        # Autocommit mode; writers issue BEGIN IMMEDIATE and let 'with conn' commit or roll back
+        conn = sqlite3.connect(get_db_path(), timeout=10, isolation_level=None)
+        # With WAL, NORMAL only syncs at checkpoints instead of on every commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Checkpoint less often during a scan; checkpoint_db() truncates the WAL once the run is over
+        conn.execute("PRAGMA wal_autocheckpoint=10000")
+        _db_local.conn = conn
+    return conn
+
+
+def close_db():
+    """Close this thread's database connection, if it has one."""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is not None:
+        _db_local.conn = None
+        conn.close()
+
+
+atexit.register(close_db)
+
+
+def checkpoint_db():
+    """Fold the WAL back into the database file and truncate it."""
+    try:
+        with db_lock:
+            get_db().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except Exception:
+        pass
+
+
 def init_db():
     """Initialize SQLite database and create required tables."""
     db_path = get_db_path()
     new_db = not os.path.exists(db_path)
 
     # Log database path for debugging
-    try:
-        error_log_dir = get_app_data_dir()
-        error_log = os.path.join(error_log_dir, 'error.log')
-        with open(error_log, 'a') as f:
-            f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] init_db: Initializing database at {db_path}\n")
-    except:
-        pass
+    write_error_log(f"init_db: Initializing database at {db_path}")
 
     try:
         with db_lock:
-            with sqlite3.connect(db_path, timeout=10) as conn:
+            conn = get_db()
+            # WAL is persistent in the file, and it has to be set outside a transaction
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
                 c = conn.cursor()
+                # One write transaction for the whole schema check instead of one per statement
+                c.execute("BEGIN IMMEDIATE")
                 c.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Clients'")
                 if not c.fetchone():
                     c.execute('''CREATE TABLE Clients
@@ -607,43 +726,36 @@ def init_db():
                                  (file_number TEXT,
                                   recipient TEXT,
                                   forwarded_at TIMESTAMP,
+                                  entry_id TEXT,
                                   PRIMARY KEY (file_number, recipient))''')
+                else:
+                    c.execute("PRAGMA table_info(ForwardedEmails)")
+                    if 'entry_id' not in [row[1] for row in c.fetchall()]:
+                        c.execute("ALTER TABLE ForwardedEmails ADD COLUMN entry_id TEXT")
+                # (file_number, recipient) lookups use the primary key's index
+                c.execute("CREATE INDEX IF NOT EXISTS idx_fe_recipient ON ForwardedEmails(recipient)")
+                c.execute("CREATE INDEX IF NOT EXISTS idx_fe_entry ON ForwardedEmails(entry_id, recipient)")
                 c.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Settings'")
                 if not c.fetchone():
                     c.execute('''CREATE TABLE Settings
                                  (key TEXT PRIMARY KEY,
                                   value TEXT)''')
-                conn.commit()
 
         # Log success
-        try:
-            with open(error_log, 'a') as f:
-                f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] init_db: Database initialized successfully (new_db={new_db})\n")
-        except:
-            pass
+        write_error_log(f"init_db: Database initialized successfully (new_db={new_db})")
 
         return new_db
     except Exception as e:
         # Log error
-        try:
-            with open(error_log, 'a') as f:
-                import traceback
-                f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] init_db ERROR: {str(e)}\n")
-                f.write(traceback.format_exc())
-                f.write("\n")
-        except:
-            pass
+        write_error_log(f"init_db ERROR: {str(e)}", include_traceback=True)
         raise Exception(f"Error initializing database: {str(e)}")
 
 
 def load_email_addresses():
     """Load all distinct recipient email addresses from the database."""
     try:
-        with db_lock:
-            with sqlite3.connect(get_db_path(), timeout=10) as conn:
-                c = conn.cursor()
-                c.execute("SELECT DISTINCT recipient FROM Clients WHERE recipient IS NOT NULL")
-                return [row[0] for row in c.fetchall()]
+        c = get_db().execute("SELECT DISTINCT recipient FROM Clients WHERE recipient IS NOT NULL")
+        return [row[0] for row in c.fetchall()]
     except Exception:
         return []
 
@@ -652,10 +764,22 @@ def save_setting(key, value):
     """Save a setting to the Settings table."""
     try:
         with db_lock:
-            with sqlite3.connect(get_db_path(), timeout=10) as conn:
-                c = conn.cursor()
-                c.execute("INSERT OR REPLACE INTO Settings (key, value) VALUES (?, ?)", (key, value))
-                conn.commit()
+            conn = get_db()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("INSERT OR REPLACE INTO Settings (key, value) VALUES (?, ?)", (key, value))
+    except Exception:
+        pass
+
+
+def save_settings(settings):
+    """Save several settings to the Settings table in one transaction."""
+    try:
+        with db_lock:
+            conn = get_db()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("INSERT OR REPLACE INTO Settings (key, value) VALUES (?, ?)", settings.items())
     except Exception:
         pass
 
@@ -663,47 +787,51 @@ def save_setting(key, value):
 def load_setting(key):
     """Load a setting from the Settings table."""
     try:
-        with db_lock:
-            with sqlite3.connect(get_db_path(), timeout=10) as conn:
-                c = conn.cursor()
-                c.execute("SELECT value FROM Settings WHERE key = ?", (key,))
-                result = c.fetchone()
-                return result[0] if result else None
+        result = get_db().execute("SELECT value FROM Settings WHERE key = ?", (key,)).fetchone()
+        return result[0] if result else None
     except Exception:
         return None
 
 
+def load_settings(keys):
+    """Load several settings with one query, as a dict holding only the keys that are set."""
+    try:
+        placeholders = ','.join('?' * len(keys))
+        return dict(get_db().execute(f"SELECT key, value FROM Settings WHERE key IN ({placeholders})",
+                                     tuple(keys)))
+    except Exception:
+        return {}
+
+
 def load_config_for_email(recipient):
     """Load configuration for a specific email address."""
     try:
-        with db_lock:
-            with sqlite3.connect(get_db_path(), timeout=10) as conn:
-                c = conn.cursor()
-                c.execute('''SELECT start_date, end_date, file_number_prefix, subject_keyword,
-                             require_attachments, skip_forwarded, delay_seconds
-                             FROM Clients WHERE recipient = ?''', (recipient,))
-                return c.fetchone()
+        return get_db().execute('''SELECT start_date, end_date, file_number_prefix, subject_keyword,
+                                  require_attachments, skip_forwarded, delay_seconds
+                                  FROM Clients WHERE recipient = ?''', (recipient,)).fetchone()
     except Exception:
         return None
 
 
 def save_config(recipient, start_date, end_date, file_number_prefix, subject_keyword,
-                require_attachments, skip_forwarded, delay_seconds):
-    """Save configuration for a recipient."""
-    created_at = datetime.datetime.now(pytz.timezone(DEFAULT_TIMEZONE)).strftime("%Y-%m-%d %H:%M:%S")
+                require_attachments, skip_forwarded, delay_seconds, settings=None):
+    """Save configuration for a recipient, and any given Settings entries, in one transaction."""
+    created_at = datetime.datetime.now(LOCAL_TZ).strftime(TIMESTAMP_FORMAT)
     try:
         with db_lock:
-            with sqlite3.connect(get_db_path(), timeout=10) as conn:
-                c = conn.cursor()
-                c.execute('''INSERT OR REPLACE INTO Clients
+            conn = get_db()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute('''INSERT OR REPLACE INTO Clients
+                                (recipient, start_date, end_date, file_number_prefix, subject_keyword,
+                                 require_attachments, skip_forwarded, delay_seconds, created_at, customer_settings,
+                                 selected_mid_customer)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
                              (recipient, start_date, end_date, file_number_prefix, subject_keyword,
-                              require_attachments, skip_forwarded, delay_seconds, created_at, customer_settings,
-                              selected_mid_customer)
-                             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                          (recipient, start_date, end_date, file_number_prefix, subject_keyword,
-                           "1" if require_attachments else "0", "1" if skip_forwarded else "0",
-                           str(delay_seconds), created_at, "", ""))
-                conn.commit()
+                              "1" if require_attachments else "0", "1" if skip_forwarded else "0",
+                              str(delay_seconds), created_at, "", ""))
+                if settings:
+                    conn.executemany("INSERT OR REPLACE INTO Settings (key, value) VALUES (?, ?)", settings.items())
         return True
     except Exception:
         return False
@@ -713,38 +841,42 @@ def delete_config(recipient):
     """Delete configuration for a recipient."""
     try:
         with db_lock:
-            with sqlite3.connect(get_db_path(), timeout=10) as conn:
-                c = conn.cursor()
-                c.execute("DELETE FROM Clients WHERE recipient = ?", (recipient,))
-                conn.commit()
-                return c.rowcount > 0
+            conn = get_db()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                c = conn.execute("DELETE FROM Clients WHERE recipient = ?", (recipient,))
+            return c.rowcount > 0
     except Exception:
         return False
 
 
-def check_if_forwarded_db(file_number, recipient):
-    """Check if file number was previously forwarded."""
+def load_forwarded_ids(recipient):
+    """Load every file number and EntryID already forwarded to a recipient as one set."""
     try:
-        with db_lock:
-            with sqlite3.connect(get_db_path(), timeout=10) as conn:
-                c = conn.cursor()
-                c.execute('''SELECT COUNT(*) FROM ForwardedEmails WHERE file_number = ? AND recipient = ?''',
-                          (file_number, recipient.lower()))
-                return c.fetchone()[0] > 0
+        c = get_db().execute("SELECT file_number, entry_id FROM ForwardedEmails WHERE recipient = ?",
+                             (recipient.lower(),))
+        forwarded_ids = set()
+        for file_number, entry_id in c:
+            forwarded_ids.add(file_number)
+            if entry_id:
+                forwarded_ids.add(entry_id)
+        return forwarded_ids
     except Exception:
-        return False
+        return set()
 
 
-def log_forwarded_email(file_number, recipient):
-    """Log forwarded email to database."""
+def log_forwarded_emails(recipient, forwarded):
+    """Log forwarded emails, given as (file_number, entry_id, forwarded_at) tuples, in one transaction."""
+    recipient = recipient.lower()
     try:
         with db_lock:
-            with sqlite3.connect(get_db_path(), timeout=10) as conn:
-                c = conn.cursor()
-                forwarded_at = datetime.datetime.now(pytz.timezone(DEFAULT_TIMEZONE)).strftime("%Y-%m-%d %H:%M:%S")
-                c.execute('''INSERT OR REPLACE INTO ForwardedEmails (file_number, recipient, forwarded_at)
-                             VALUES (?, ?, ?)''', (file_number, recipient.lower(), forwarded_at))
-                conn.commit()
+            conn = get_db()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany('''INSERT OR REPLACE INTO ForwardedEmails (file_number, recipient, forwarded_at, entry_id)
+                                    VALUES (?, ?, ?, ?)''',
+                                 [(file_number, recipient, forwarded_at, entry_id)
+                                  for file_number, entry_id, forwarded_at in forwarded])
     except Exception:
         pass
 
@@ -752,10 +884,12 @@ def log_forwarded_email(file_number, recipient):
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+
 def validate_email(email):
     """Validate email address format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return EMAIL_PATTERN.fullmatch(email) is not None
 
 
 def sanitize_filter_value(value):
@@ -765,72 +899,224 @@ def sanitize_filter_value(value):
     return value.replace("'", "''").replace("%", "%%")
 
 
-def convert_date_format(date_str):
-    """Convert date between formats."""
-    if not date_str or not date_str.strip():
-        return None
+@lru_cache(maxsize=32)
+def build_subject_filter(subject_keyword):
+    """Build the DASL subject condition for a keyword (cached per keyword)."""
+    return SUBJECT_FILTER_TEMPLATE.format(keyword=sanitize_filter_value(subject_keyword))
+
+
+def build_restrict_filter(subject_keyword, start_date, end_date, require_attachments=False):
+    """Build the DASL filter for mail items matching the subject keyword and inclusive SentOn range."""
+    # end_date is 23:59:59, so the exclusive upper bound is the following midnight
+    sent_on_filter = SENT_ON_FILTER_TEMPLATE.format(
+        start=start_date.astimezone(pytz.utc).strftime(DASL_DATE_FORMAT),
+        end=(end_date + datetime.timedelta(seconds=1)).astimezone(pytz.utc).strftime(DASL_DATE_FORMAT))
+    restrict_filter = f"@SQL={build_subject_filter(subject_keyword)} AND {sent_on_filter} AND {MAIL_CLASS_FILTER}"
+    if require_attachments:
+        restrict_filter += f" AND {HAS_ATTACHMENT_FILTER}"
+    return restrict_filter
+
+
+def join_limited(lines, limit):
+    """Join lines with newlines, stopping before the text would exceed limit characters."""
+    parts = []
+    length = 0
+    for line in lines:
+        length += len(line) + 1
+        if length > limit + 1:
+            break
+        parts.append(line)
+    return "\n".join(parts)
+
+
+def parse_stored_date(date_str):
+    """Parse a stored YYYY-MM-DD or MM/DD/YYYY date into a QDate, which is invalid if it is neither."""
+    # Both layouts are fixed, so the fields are split out instead of running QDate's format parser
     try:
-        parsed_date = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-        return parsed_date.strftime("%m/%d/%Y")
+        if '-' in date_str:
+            year, month, day = date_str.split('-')
+        else:
+            month, day, year = date_str.split('/')
+        return QDate(int(year), int(month), int(day))
     except ValueError:
-        try:
-            datetime.datetime.strptime(date_str, "%m/%d/%Y")
-            return date_str
-        except ValueError:
-            return None
+        return QDate()
 
 
-def extract_file_number(item, file_number_prefixes):
-    """Extract file number from email."""
-    try:
-        if item.Attachments.Count > 0:
-            attachment = item.Attachments.Item(1)
-            filename = os.path.splitext(attachment.FileName)[0]
-            for prefix in file_number_prefixes:
-                match = re.search(rf'{prefix}\d{{{7-len(prefix)}}}', filename)
-                if match:
-                    return match.group(0)
-        subject = item.Subject if item.Subject else ""
-        for prefix in file_number_prefixes:
-            match = re.search(rf'{prefix}\d{{{7-len(prefix)}}}', subject)
+def get_date_bounds(start_day, end_day):
+    """Convert two calendar dates into a localized start-of-day/end-of-day range."""
+    start_date = LOCAL_TZ.localize(datetime.datetime.combine(start_day, datetime.time.min))
+    end_date = LOCAL_TZ.localize(datetime.datetime.combine(end_day, datetime.time(23, 59, 59)))
+    return start_date, end_date
+
+
+def parse_file_number_prefixes(file_number_prefix):
+    """Split the comma-separated prefix setting into a tuple of non-empty prefixes."""
+    if not file_number_prefix:
+        return ()
+    return tuple(p.strip() for p in file_number_prefix.split(',') if p.strip())
+
+
+def compile_file_number_matchers(file_number_prefixes):
+    """Pair each prefix, in configured order, with a compiled pattern for the digits that follow it."""
+    # A tuple so it can be part of the match_file_number cache key
+    return tuple((prefix, re.compile(rf'\d{{{7-len(prefix)}}}')) for prefix in file_number_prefixes)
+
+
+def find_file_number(text, file_number_matchers):
+    """Return the file number for the earliest configured prefix found in text, or None."""
+    for prefix, digits in file_number_matchers:
+        # str.find locates the literal prefix in C; the regex only checks the digits right after it
+        start = text.find(prefix)
+        while start >= 0:
+            match = digits.match(text, start + len(prefix))
             if match:
-                return match.group(0)
-        return None
+                return prefix + match.group(0)
+            start = text.find(prefix, start + 1)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def match_file_number(text, file_number_matchers):
+    """Cached find_file_number; subjects and attachment names repeat across emails and runs."""
+    return find_file_number(text, file_number_matchers)
+
+
+def extract_file_number(item, subject, file_number_matchers):
+    """Extract file number from an email with attachments: first attachment's name, then the subject."""
+    try:
+        # Callers know from PR_HASATTACH that there is an attachment, so no Attachments.Count round-trip
+        filename = item.Attachments.Item(1).FileName
+        # Plain filename, so skip os.path.splitext's separator handling
+        dot = filename.rfind('.')
+        if dot > 0:
+            filename = filename[:dot]
+        file_number = match_file_number(filename, file_number_matchers)
+        if file_number:
+            return file_number
     except Exception:
-        return None
+        pass
+    return match_file_number(subject, file_number_matchers)
 
 
 # ============================================================================
 # WORKER THREAD
 # ============================================================================
-class OutlookWorker(QThread):
-    """Worker thread for Outlook operations."""
+# Outlook profile name; only used for a log line, so it is looked up once per session
+_outlook_user_name = None
+# Outlook MAPI namespace per thread; COM proxies belong to the apartment that created them
+_outlook_local = threading.local()
 
-    def __init__(self, config, operation='forward'):
+
+def get_outlook_namespace():
+    """Return this thread's Outlook MAPI namespace, connecting on first use or after Outlook restarts."""
+    mapi = getattr(_outlook_local, 'mapi', None)
+    if mapi is not None:
+        try:
+            # One cheap property read to make sure Outlook was not closed since the last run
+            mapi.Type
+            return mapi
+        except Exception:
+            _outlook_local.mapi = None
+    try:
+        outlook = win32com.client.Dispatch("Outlook.Application")
+    except Exception as e:
+        error_code = getattr(e, 'hresult', None) or (e.args[0] if e.args else None)
+        if error_code == -2147221005:
+            raise Exception(
+                "Cannot connect to Outlook. Please ensure:\n\n"
+                "1. Microsoft Outlook is installed\n"
+                "2. Outlook is open and running\n"
+                "3. Python and Outlook are both 32-bit or both 64-bit\n"
+                "4. Try running as Administrator"
+            )
+        raise Exception(f"Failed to connect to Outlook: {str(e)}")
+    _outlook_local.mapi = outlook.GetNamespace("MAPI")
+    return _outlook_local.mapi
+
+
+def release_outlook_namespace():
+    """Drop this thread's cached Outlook namespace before COM is uninitialized."""
+    _outlook_local.mapi = None
+
+
+class OutlookThread(QThread):
+    """Long-lived thread that runs Outlook operations in its own COM apartment."""
+
+    def run(self):
+        """Initialize COM and process queued operations until the thread is stopped."""
+        # Single-threaded apartment: Outlook is an STA server, and the loops pump
+        # waiting messages so calls back into this thread are never left waiting
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        try:
+            self.exec_()
+        finally:
+            release_outlook_namespace()
+            close_db()
+            pythoncom.CoUninitialize()
+
+
+class OutlookWorker(QObject):
+    """Worker for Outlook operations; lives on an OutlookThread for the whole session."""
+
+    def __init__(self):
         super().__init__()
-        self.config = config
-        self.operation = operation
+        self.config = None
+        self.operation = None
         self.signals = WorkerSignals()
-        self.cancel_flag = False
+        # An Event rather than a bool so the delay between forwards can wake on cancel
+        self.cancel_event = threading.Event()
+        # Log lines are sent to the GUI in batches rather than one queued signal each
+        self._log_buf = []
+        self.emails_scanned = 0  # Rows read by the last scan
 
     def cancel(self):
-        """Set cancel flag to stop operation."""
-        self.cancel_flag = True
+        """Signal the operation to stop."""
+        self.cancel_event.set()
 
-    def run(self):
-        """Execute the Outlook operation."""
-        pythoncom.CoInitialize()
+    @pyqtSlot(object, str)
+    def run_task(self, config, operation):
+        """Execute one Outlook operation with the given configuration."""
+        self.config = config
+        self.operation = operation
         try:
-            if self.operation == 'forward':
+            if operation == 'forward':
                 self._forward_emails()
-            elif self.operation == 'search':
+            elif operation == 'search':
                 self._search_emails()
         finally:
-            pythoncom.CoUninitialize()
+            self._flush_log()
+            self.signals.task_finished.emit()
 
     def _log(self, message):
-        """Emit log message signal."""
-        self.signals.log_message.emit(message)
+        """Buffer a log message, emitting the buffer once it holds LOG_BUFFER_SIZE lines."""
+        self._log_buf.append(message)
+        if len(self._log_buf) >= LOG_BUFFER_SIZE:
+            self._flush_log()
+
+    def _flush_log(self):
+        """Emit all buffered log messages as one log message signal."""
+        if self._log_buf:
+            self.signals.log_message.emit('\n'.join(self._log_buf))
+            self._log_buf.clear()
+
+    def _log_skip_summary(self, skip_reasons):
+        """Log one line with the per-reason totals of skipped emails."""
+        parts = [f"{count} {reason}" for reason, count in skip_reasons.items() if count]
+        if parts:
+            self._log(f"Skipped: {', '.join(parts)}.")
+
+    def _flush_forward_log(self, recipient, pending_logs):
+        """Write buffered forward log rows in one transaction and empty the buffer."""
+        if pending_logs:
+            log_forwarded_emails(recipient, pending_logs)
+            pending_logs.clear()
+
+    def _get_user_name(self, mapi):
+        """Return the Outlook profile's user name, caching it after the first lookup."""
+        global _outlook_user_name
+        if _outlook_user_name is None:
+            _outlook_user_name = mapi.CurrentUser.Name
+        return _outlook_user_name
 
     def _get_outlook_folder(self, mapi):
         """Get Outlook Sent Items folder."""
@@ -841,114 +1127,159 @@ class OutlookWorker(QThread):
         except Exception as e:
             raise Exception(f"Error accessing Sent Items folder: {str(e)}")
 
-    def _search_emails(self):
-        """Search for matching emails."""
-        try:
-            config = self.config
-            subject_keyword = config['subject_keyword']
-            start_date_str = config['start_date']
-            end_date_str = config['end_date']
-            skip_forwarded = config['skip_forwarded']
-            recipient = config['recipient']
-            file_number_prefix = config.get('file_number_prefix', '')
-            file_number_prefixes = [p.strip() for p in file_number_prefix.split(',') if p.strip()] if file_number_prefix else []
-
-            local_tz = pytz.timezone(DEFAULT_TIMEZONE)
-            start_date = local_tz.localize(datetime.datetime.strptime(start_date_str, "%m/%d/%Y"))
-            end_date = local_tz.localize(datetime.datetime.strptime(end_date_str, "%m/%d/%Y") +
-                                          datetime.timedelta(days=1) - datetime.timedelta(seconds=1))
+    def _iter_candidates(self, mapi, require_attachments, skip_reasons, forwarded_ids, progress_message):
+        """Scan Sent Items and yield each email that passes the configured filters.
 
-            try:
-                outlook = win32com.client.Dispatch("Outlook.Application")
-            except Exception as e:
-                error_code = getattr(e, 'hresult', None) or (e.args[0] if e.args else None)
-                if error_code == -2147221005:
-                    raise Exception(
-                        "Cannot connect to Outlook. Please ensure:\n\n"
-                        "1. Microsoft Outlook is installed\n"
-                        "2. Outlook is open and running\n"
-                        "3. Python and Outlook are both 32-bit or both 64-bit\n"
-                        "4. Try running as Administrator"
-                    )
-                raise Exception(f"Failed to connect to Outlook: {str(e)}")
-            mapi = outlook.GetNamespace("MAPI")
-            folder = self._get_outlook_folder(mapi)
-            folder.Items.Sort("[SentOn]", True)
-
-            sanitized_subject = sanitize_filter_value(subject_keyword)
-            restrict_filter = f"@SQL=\"urn:schemas:httpmail:subject\" ci_phrasematch '{sanitized_subject}'"
+        Yields (entry_id, subject, sent_on, has_attachments, file_number, tracking_id, mail), where
+        tracking_id is the key forwards are recorded under and mail is the opened item if reading
+        the attachment name needed it, else None. Stops early on cancel;
+        self.emails_scanned holds the number of rows read once the scan ends.
+        """
+        config = self.config
+        subject_keyword = config['subject_keyword']
+        file_number_prefixes = config['file_number_prefixes']
+        skip_forwarded = config['skip_forwarded']
+        start_date, end_date = config['date_bounds']
+
+        folder = self._get_outlook_folder(mapi)
 
+        restrict_filter = build_restrict_filter(subject_keyword, start_date, end_date, require_attachments)
+
+        # No .Count here - it makes Outlook enumerate the restricted set twice
+        try:
+            table = folder.GetTable(restrict_filter)
+            outlook_filtered = True
+        except Exception:
+            table = folder.GetTable()
+            outlook_filtered = False
+        # Scan a read-only table of just these columns so Outlook never builds
+        # item objects; the few candidates that pass are opened with GetItemFromID
+        table.Columns.RemoveAll()
+        for column in TABLE_COLUMNS:
+            table.Columns.Add(column)
+
+        # Outlook already matched the keyword, date range and item type; only re-check when unfiltered
+        keyword_folded = subject_keyword.casefold()
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+        file_number_matchers = compile_file_number_matchers(file_number_prefixes)
+
+        self._log("Scanning emails...")
+        emails_scanned = 0
+        last_log_t = time.monotonic()
+
+        # Bound once so the per-row calls skip the attribute lookups; win32com resolves
+        # a late-bound method name in Python on every access
+        cancel_requested = self.cancel_event.is_set
+        get_next_row = table.GetNextRow
+        monotonic = time.monotonic
+        while not table.EndOfTable:
+            if cancel_requested():
+                break
+
+            # One COM call per row for all columns
+            entry_id, subject, sent_on, message_class, has_attachments = get_next_row().GetValues()
+            emails_scanned += 1
+
+            # Progress is throttled by time so fast scans don't flood the GUI thread
+            now = monotonic()
+            if now - last_log_t >= PROGRESS_LOG_INTERVAL:
+                last_log_t = now
+                pythoncom.PumpWaitingMessages()
+                self._log(progress_message(emails_scanned))
+                self._flush_log()
+
+            # Mail items (olMail) are the IPM.Note message classes; the filter already ensures it
+            if not outlook_filtered and not message_class.startswith("IPM.Note"):
+                continue
             try:
-                filtered_items = folder.Items.Restrict(restrict_filter)
-                total_emails = filtered_items.Count
-            except Exception:
-                filtered_items = folder.Items
-                total_emails = filtered_items.Count
-
-            self._log(f"Scanning {total_emails} emails...")
-            matching_emails = []
-            emails_scanned = 0
-
-            for i, item in enumerate(filtered_items, 1):
-                if self.cancel_flag:
-                    break
-                emails_scanned += 1
-
-                if item.Class == 43:
-                    try:
-                        subject = item.Subject if item.Subject else "(No Subject)"
-                        if not subject or subject_keyword.upper() not in subject.upper():
-                            continue
-
-                        file_number = None
-                        if file_number_prefixes:
-                            file_number = extract_file_number(item, file_number_prefixes)
-                            if not file_number:
-                                continue
-
-                        sent_on = item.SentOn
-                        if sent_on < start_date or sent_on > end_date:
-                            continue
-
-                        # Use file_number if available, otherwise use EntryID as unique identifier
-                        tracking_id = file_number if file_number else item.EntryID
-
-                        if skip_forwarded and check_if_forwarded_db(tracking_id, recipient):
-                            continue
-
-                        info = f"[{sent_on.strftime('%Y-%m-%d %H:%M:%S')}] {subject}"
-                        if file_number:
-                            info += f" (File Number: {file_number})"
-                        matching_emails.append(info)
-                    except Exception:
+                subject = subject if subject else "(No Subject)"
+                if not outlook_filtered:
+                    if keyword_folded not in subject.casefold():
+                        continue
+                    sent_ts = sent_on.timestamp()
+                    if sent_ts < start_ts or sent_ts > end_ts:
+                        skip_reasons['outside date range'] += 1
+                        continue
+                    if require_attachments and not has_attachments:
+                        skip_reasons['without attachments'] += 1
+                        continue
+
+                # Opened lazily: only attachment names and a forward need the full item
+                mail = None
+                file_number = None
+                if file_number_prefixes:
+                    if has_attachments:
+                        mail = mapi.GetItemFromID(entry_id)
+                        file_number = extract_file_number(mail, subject, file_number_matchers)
+                    else:
+                        # No attachment name to check, so the item never needs opening
+                        file_number = match_file_number(subject, file_number_matchers)
+                    if not file_number:
+                        skip_reasons['without file number'] += 1
                         continue
 
-                if i % 100 == 0:
-                    self._log(f"Scanned {i}/{total_emails} emails...")
+                # Use file_number if available, otherwise use EntryID as unique identifier;
+                # an email forwarded under its EntryID counts too once it has a file number
+                tracking_id = file_number or entry_id
+                if skip_forwarded and (tracking_id in forwarded_ids or
+                                       (file_number and entry_id in forwarded_ids)):
+                    skip_reasons['already forwarded'] += 1
+                    continue
+            except Exception as e:
+                self._log(f"Error processing email: {str(e)}")
+                continue
+
+            yield entry_id, subject, sent_on, has_attachments, file_number, tracking_id, mail
 
-            self.signals.search_complete.emit(emails_scanned, matching_emails)
+        self.emails_scanned = emails_scanned
+
+    def _search_emails(self):
+        """Search for matching emails."""
+        try:
+            config = self.config
+            mapi = get_outlook_namespace()
+
+            # Only the lines the results dialog can show are kept; the rest are just counted
+            matches_found = 0
+            preview_lines = []
+            preview_chars = 0
+            # Skips are counted and summarized once instead of logged per item
+            skip_reasons = {'outside date range': 0, 'without file number': 0, 'already forwarded': 0}
+            # One query up front instead of a database round-trip per candidate
+            forwarded_ids = load_forwarded_ids(config['recipient']) if config['skip_forwarded'] else set()
+
+            def progress_message(emails_scanned):
+                return f"Scanned {emails_scanned} emails, skipped {sum(skip_reasons.values())}..."
+
+            candidates = self._iter_candidates(mapi, False, skip_reasons, forwarded_ids, progress_message)
+            for entry_id, subject, sent_on, has_attachments, file_number, tracking_id, mail in candidates:
+                info = f"[{sent_on.strftime(TIMESTAMP_FORMAT)}] {subject}"
+                if file_number:
+                    info += f" (File Number: {file_number})"
+                matches_found += 1
+                if preview_chars <= SEARCH_PREVIEW_CHARS:
+                    preview_lines.append(info)
+                    preview_chars += len(info) + 1
+
+            self._log_skip_summary(skip_reasons)
+            self._flush_log()
+            self.signals.search_complete.emit(self.emails_scanned, matches_found, preview_lines)
 
         except Exception as e:
+            self._flush_log()
             self.signals.error.emit(str(e))
 
     def _forward_emails(self):
         """Forward matching emails."""
+        config = self.config
+        recipient = config['recipient']
+        # Forward log rows not yet written; always flushed before the worker exits
+        pending_logs = []
         try:
-            config = self.config
-            recipient = config['recipient']
-            subject_keyword = config['subject_keyword']
-            start_date_str = config['start_date']
-            end_date_str = config['end_date']
-            file_number_prefix = config.get('file_number_prefix', '')
-            file_number_prefixes = [p.strip() for p in file_number_prefix.split(',') if p.strip()] if file_number_prefix else []
-            require_attachments = config['require_attachments']
-            skip_forwarded = config['skip_forwarded']
             delay_seconds = float(config.get('delay_seconds', 0))
 
-            local_tz = pytz.timezone(DEFAULT_TIMEZONE)
-            start_date = local_tz.localize(datetime.datetime.strptime(start_date_str, "%m/%d/%Y"))
-            end_date = local_tz.localize(datetime.datetime.strptime(end_date_str, "%m/%d/%Y") +
-                                          datetime.timedelta(days=1) - datetime.timedelta(seconds=1))
+            start_date, end_date = config['date_bounds']
 
             # Check if date range > 8 days
             date_range_days = (end_date.date() - start_date.date()).days
@@ -956,107 +1287,96 @@ class OutlookWorker(QThread):
                 delay_seconds = max(delay_seconds, 3.0)
                 self._log(f"Date range of {date_range_days} days. Using 3-second delay.")
 
-            self.signals.clear_subjects.emit()
-
-            try:
-                outlook = win32com.client.Dispatch("Outlook.Application")
-            except Exception as e:
-                error_code = getattr(e, 'hresult', None) or (e.args[0] if e.args else None)
-                if error_code == -2147221005:
-                    raise Exception(
-                        "Cannot connect to Outlook. Please ensure:\n\n"
-                        "1. Microsoft Outlook is installed\n"
-                        "2. Outlook is open and running\n"
-                        "3. Python and Outlook are both 32-bit or both 64-bit\n"
-                        "4. Try running as Administrator"
-                    )
-                raise Exception(f"Failed to connect to Outlook: {str(e)}")
-            mapi = outlook.GetNamespace("MAPI")
-            self._log(f"Accessing Outlook account: {mapi.CurrentUser.Name}")
-
-            folder = self._get_outlook_folder(mapi)
-            folder.Items.Sort("[SentOn]", True)
-
-            sanitized_subject = sanitize_filter_value(subject_keyword)
-            restrict_filter = f"@SQL=\"urn:schemas:httpmail:subject\" ci_phrasematch '{sanitized_subject}'"
+            mapi = get_outlook_namespace()
+            self._log(f"Accessing Outlook account: {self._get_user_name(mapi)}")
 
-            try:
-                filtered_items = folder.Items.Restrict(restrict_filter)
-                total_emails = filtered_items.Count
-            except Exception:
-                filtered_items = folder.Items
-                total_emails = filtered_items.Count
-
-            self._log(f"Scanning {total_emails} emails...")
             emails_processed = 0
-            emails_scanned = 0
-
-            for i, item in enumerate(filtered_items, 1):
-                if self.cancel_flag:
-                    self._log(f"Operation cancelled. Scanned {emails_scanned}, forwarded {emails_processed}.")
-                    break
-
-                emails_scanned += 1
-
-                if item.Class == 43:
-                    try:
-                        subject = item.Subject if item.Subject else "(No Subject)"
-                        if not subject or subject_keyword.upper() not in subject.upper():
-                            continue
-
-                        file_number = None
-                        if file_number_prefixes:
-                            file_number = extract_file_number(item, file_number_prefixes)
-                            if not file_number:
-                                continue
-
-                        sent_on = item.SentOn
-                        if sent_on < start_date or sent_on > end_date:
-                            continue
-
-                        if require_attachments and item.Attachments.Count == 0:
-                            continue
-
-                        # Use file_number if available, otherwise use EntryID as unique identifier
-                        tracking_id = file_number if file_number else item.EntryID
-
-                        if skip_forwarded and check_if_forwarded_db(tracking_id, recipient):
-                            continue
-
-                        new_subject = file_number if file_number else subject
-
-                        # Collect attachment names
-                        attachment_names = []
-                        if item.Attachments.Count > 0:
-                            for att in item.Attachments:
-                                attachment_names.append(att.FileName)
-                        attachments_str = ", ".join(attachment_names) if attachment_names else "No attachments"
-
-                        forward_email = item.Forward()
-                        forward_email.To = recipient
-                        forward_email.Subject = new_subject
-                        forward_email.Send()
-
-                        emails_processed += 1
-                        self._log(f"Forwarded: {new_subject}")
-                        # Show the sent subject (new_subject) in preview
-                        self.signals.display_subject.emit(new_subject, recipient, attachments_str)
+            # Skips are counted and summarized once instead of logged per item
+            skip_reasons = {'outside date range': 0, 'without attachments': 0,
+                            'without file number': 0, 'already forwarded': 0}
+            # One query up front instead of a database round-trip per candidate
+            forwarded_ids = load_forwarded_ids(recipient) if config['skip_forwarded'] else set()
+
+            def progress_message(emails_scanned):
+                return (f"Scanned {emails_scanned}, forwarded {emails_processed}, "
+                        f"skipped {sum(skip_reasons.values())}...")
+
+            candidates = self._iter_candidates(mapi, config['require_attachments'], skip_reasons,
+                                               forwarded_ids, progress_message)
+            for entry_id, subject, sent_on, has_attachments, file_number, tracking_id, mail in candidates:
+                try:
+                    new_subject = file_number if file_number else subject
+                    if mail is None:
+                        mail = mapi.GetItemFromID(entry_id)
+
+                    # Collect attachment names
+                    attachment_names = []
+                    if has_attachments:
+                        for att in mail.Attachments:
+                            attachment_names.append(att.FileName)
+                    attachments_str = ", ".join(attachment_names) if attachment_names else "No attachments"
+
+                    forward_email = mail.Forward()
+                    forward_email.To = recipient
+                    forward_email.Subject = new_subject
+                    forward_email.Send()
+
+                    emails_processed += 1
+                    self._log(f"Forwarded: {new_subject}")
+                    # Show the sent subject (new_subject) in preview
+                    self.signals.display_subject.emit(new_subject, recipient, attachments_str)
+
+                    # Written now when a delay follows anyway; batched when forwarding back-to-back
+                    pending_logs.append((tracking_id, entry_id,
+                                         datetime.datetime.now(LOCAL_TZ).strftime(TIMESTAMP_FORMAT)))
+                    if delay_seconds > 0 or len(pending_logs) >= FORWARD_LOG_BATCH_SIZE:
+                        self._flush_forward_log(recipient, pending_logs)
+                    # Keep the prefetched set current for the rest of this run
+                    forwarded_ids.add(tracking_id)
+                    forwarded_ids.add(entry_id)
+
+                    if delay_seconds > 0:
+                        # Show what was sent before sitting idle for the delay
+                        self._flush_log()
+                        # Returns early on cancel; the scan then stops before the next row
+                        self.cancel_event.wait(delay_seconds)
+                except Exception as e:
+                    self._log(f"Error processing email: {str(e)}")
+                    continue
+
+            emails_scanned = self.emails_scanned
+            if self.cancel_event.is_set():
+                self._log(f"Operation cancelled. Scanned {emails_scanned}, forwarded {emails_processed}.")
+            self._log_skip_summary(skip_reasons)
+            self._flush_forward_log(recipient, pending_logs)
+            if emails_processed:
+                checkpoint_db()
+            self._flush_log()
+            self.signals.operation_complete.emit(emails_scanned, emails_processed)
 
-                        log_forwarded_email(tracking_id, recipient)
+        except Exception as e:
+            self._flush_log()
+            self.signals.error.emit(str(e))
+        finally:
+            self._flush_forward_log(recipient, pending_logs)
 
-                        if delay_seconds > 0:
-                            time.sleep(delay_seconds)
-                    except Exception as e:
-                        self._log(f"Error processing email: {str(e)}")
-                        continue
 
-                if i % 100 == 0:
-                    self._log(f"Scanned {i}/{total_emails}, forwarded {emails_processed}...")
+class DatabaseLoader(QThread):
+    """Background thread that initializes the database and reads the recipient list at startup."""
 
-            self.signals.operation_complete.emit(emails_scanned, emails_processed)
+    def __init__(self):
+        super().__init__()
+        self.signals = DatabaseLoadSignals()
 
+    def run(self):
+        """Initialize the database and emit the saved recipients."""
+        try:
+            init_db()
+            self.signals.loaded.emit(load_email_addresses())
         except Exception as e:
             self.signals.error.emit(str(e))
+        finally:
+            close_db()
 
 
 # ============================================================================
@@ -1072,18 +1392,6 @@ class ConfigDialog(QDialog):
             self.setWindowTitle("Configuration & Help")
             self.setFixedSize(520, 480)
 
-            # Try to apply stylesheet
-            try:
-                self.setStyleSheet(STYLESHEET)
-            except Exception as style_error:
-                # Log to file if stylesheet fails
-                try:
-                    error_log = os.path.join(get_app_data_dir(), 'error.log')
-                    with open(error_log, 'a') as f:
-                        f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Stylesheet error: {style_error}\n")
-                except:
-                    pass
-
             layout = QVBoxLayout(self)
             layout.setContentsMargins(15, 15, 15, 15)
             layout.setSpacing(10)
@@ -1253,17 +1561,17 @@ class ConfigDialog(QDialog):
 
         except Exception as e:
             # Log critical error to file
-            try:
-                error_log = os.path.join(get_app_data_dir(), 'error.log')
-                with open(error_log, 'a') as f:
-                    import traceback
-                    f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] ConfigDialog error:\n")
-                    f.write(traceback.format_exc())
-                    f.write("\n")
-            except:
-                pass
+            write_error_log("ConfigDialog error:", include_traceback=True)
             raise
 
+    def set_values(self, prefix, delay, require_attach, skip_fwd, auto_update):
+        """Load current settings into the dialog fields."""
+        self.prefix_edit.setText(prefix)
+        self.delay_edit.setText(delay)
+        self.require_attach_check.setChecked(require_attach)
+        self.skip_fwd_check.setChecked(skip_fwd)
+        self.auto_update_check.setChecked(auto_update)
+
     def get_values(self):
         """Return dialog values."""
         return {
@@ -1285,7 +1593,6 @@ class UpdateProgressDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Downloading Update")
         self.setFixedSize(400, 150)
-        self.setStyleSheet(STYLESHEET)
         self.setWindowFlags(Qt.Dialog | Qt.WindowTitleHint | Qt.CustomizeWindowHint)
 
         layout = QVBoxLayout(self)
@@ -1339,9 +1646,12 @@ class UpdateProgressDialog(QDialog):
 class DocuShuttleWindow(QMainWindow):
     """Main application window."""
 
+    # Queued to the worker's thread: configuration dict, operation name
+    run_requested = pyqtSignal(object, str)
+
     def __init__(self):
         super().__init__()
-        self.worker = None
+        self.operation_running = False
         self.config_prefix = "76"
         self.config_delay = "0"
         self.config_require_attachments = True
@@ -1350,9 +1660,11 @@ class DocuShuttleWindow(QMainWindow):
         self.update_checker = None
         self.pending_update_path = None
         self.progress_dialog = None
+        self.config_dialog = None  # Created on first use, then reused
+        self.last_recipient = None  # Recipient whose config was last applied
 
         self.init_ui()
-        self.load_saved_state()
+        self.init_worker()
         # Delay update check until after window is shown
         QTimer.singleShot(1000, self.check_for_updates_on_startup)
 
@@ -1363,12 +1675,9 @@ class DocuShuttleWindow(QMainWindow):
         self.resize(700, 650)
 
         # Set window icon
-        if os.path.exists(ICON_PNG_PATH):
-            self.setWindowIcon(QIcon(ICON_PNG_PATH))
-        elif os.path.exists(ICON_PATH):
-            self.setWindowIcon(QIcon(ICON_PATH))
-
-        self.setStyleSheet(STYLESHEET)
+        app_icon = get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
 
         # Central widget
         central = QWidget()
@@ -1377,7 +1686,37 @@ class DocuShuttleWindow(QMainWindow):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
 
-        # Header
+        main_layout.addWidget(self._build_header())
+
+        # Content area
+        content = QWidget()
+        content_layout = QVBoxLayout(content)
+        content_layout.setContentsMargins(15, 15, 15, 15)
+
+        # Tab widget
+        tabs = QTabWidget()
+        content_layout.addWidget(tabs)
+
+        tabs.addTab(self._build_search_tab(), "  Search  ")
+        tabs.addTab(self._build_log_tab(), "  Log  ")
+        tabs.currentChanged.connect(self.on_tab_changed)
+        self.tabs = tabs
+
+        main_layout.addWidget(content)
+
+        # Initialize the database off the GUI thread so the splash keeps animating;
+        # saved state is loaded once it finishes, and until then nothing can run and
+        # no recipient can be picked (its config could not be loaded yet)
+        self.preview_btn.setEnabled(False)
+        self.forward_btn.setEnabled(False)
+        self.recipient_combo.setEnabled(False)
+        self.db_loader = DatabaseLoader()
+        self.db_loader.signals.loaded.connect(self.on_database_loaded)
+        self.db_loader.signals.error.connect(self.on_database_error)
+        self.db_loader.start()
+
+    def _build_header(self):
+        """Build the header bar with the brand and the configuration menu."""
         header = QFrame()
         header.setObjectName("headerFrame")
         header.setFixedHeight(60)
@@ -1390,9 +1729,8 @@ class DocuShuttleWindow(QMainWindow):
 
         # Add logo icon (load from myicon.png)
         logo_label = QLabel()
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'myicon.png')
-        if os.path.exists(icon_path):
-            logo_pixmap = QPixmap(icon_path).scaled(36, 36, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        logo_pixmap = get_logo_pixmap()
+        if logo_pixmap is not None:
             logo_label.setPixmap(logo_pixmap)
         logo_label.setFixedSize(40, 40)
         brand_layout.addWidget(logo_label)
@@ -1416,37 +1754,12 @@ class DocuShuttleWindow(QMainWindow):
         self.config_menu_btn = QToolButton()
         self.config_menu_btn.setText("☰")
         self.config_menu_btn.setFixedSize(36, 36)
-        self.config_menu_btn.setStyleSheet(f"""
-            QToolButton {{
-                background-color: transparent;
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-                font-size: 16pt;
-                color: {COLORS['text']};
-            }}
-            QToolButton:hover {{
-                background-color: #E8E8E8;
-                border: 1px solid {COLORS['border']};
-            }}
-        """)
+        self.config_menu_btn.setObjectName("menuButton")
         self.config_menu_btn.setPopupMode(QToolButton.InstantPopup)
 
         # Create menu for config button
         config_menu = QMenu(self.config_menu_btn)
-        config_menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {COLORS['frame_bg']};
-                border: 1px solid {COLORS['border']};
-                padding: 5px;
-            }}
-            QMenu::item {{
-                padding: 8px 20px;
-            }}
-            QMenu::item:selected {{
-                background-color: {COLORS['primary']};
-                color: white;
-            }}
-        """)
+        config_menu.setObjectName("popupMenu")
 
         config_action = config_menu.addAction("Configuration...")
         config_action.triggered.connect(self.show_config_dialog)
@@ -1462,18 +1775,10 @@ class DocuShuttleWindow(QMainWindow):
         self.config_menu_btn.setMenu(config_menu)
         header_layout.addWidget(self.config_menu_btn)
 
-        main_layout.addWidget(header)
-
-        # Content area
-        content = QWidget()
-        content_layout = QVBoxLayout(content)
-        content_layout.setContentsMargins(15, 15, 15, 15)
-
-        # Tab widget
-        tabs = QTabWidget()
-        content_layout.addWidget(tabs)
+        return header
 
-        # Search tab
+    def _build_search_tab(self):
+        """Build the Search tab with its settings, results table and buttons."""
         search_tab = QWidget()
         search_layout = QVBoxLayout(search_tab)
         search_layout.setContentsMargins(10, 15, 10, 10)
@@ -1488,10 +1793,24 @@ class DocuShuttleWindow(QMainWindow):
         # Forward To combobox with right-click context menu
         self.recipient_combo = QComboBox()
         self.recipient_combo.setEditable(True)
+        # Backed by a string list model so the whole list is replaced in one reset
+        self.recipient_model = QStringListModel(self)
+        self.recipient_combo.setModel(self.recipient_model)
         self.recipient_combo.setMinimumWidth(320)
         self.recipient_combo.currentTextChanged.connect(self.on_recipient_changed)
+        # Typing in the combobox changes the text on every keystroke; only load the
+        # recipient's config once the text has been left alone for 250ms
+        self.recipient_timer = QTimer(self)
+        self.recipient_timer.setSingleShot(True)
+        self.recipient_timer.setInterval(250)
+        self.recipient_timer.timeout.connect(self.apply_recipient_change)
         self.recipient_combo.setContextMenuPolicy(Qt.CustomContextMenu)
         self.recipient_combo.customContextMenuRequested.connect(self.show_email_context_menu)
+        # Built once and shown again on each right-click
+        self.email_context_menu = QMenu(self)
+        self.email_context_menu.setObjectName("popupMenu")
+        delete_action = self.email_context_menu.addAction("Delete Email")
+        delete_action.triggered.connect(self.delete_current_config)
 
         email_layout.addRow("Forward To:", self.recipient_combo)
 
@@ -1508,12 +1827,13 @@ class DocuShuttleWindow(QMainWindow):
         date_layout.setContentsMargins(15, 20, 15, 15)
         date_layout.setSpacing(20)
 
+        today = QDate.currentDate()
         start_layout = QHBoxLayout()
         start_layout.addWidget(QLabel("Start Date:"))
         self.start_date = QDateEdit()
         self.start_date.setCalendarPopup(True)
-        self.start_date.setDate(QDate.currentDate())
-        self.start_date.setDisplayFormat("MM/dd/yyyy")
+        self.start_date.setDate(today)
+        self.start_date.setDisplayFormat(QDATE_FORMAT)
         start_layout.addWidget(self.start_date)
         date_layout.addLayout(start_layout)
 
@@ -1521,8 +1841,8 @@ class DocuShuttleWindow(QMainWindow):
         end_layout.addWidget(QLabel("End Date:"))
         self.end_date = QDateEdit()
         self.end_date.setCalendarPopup(True)
-        self.end_date.setDate(QDate.currentDate())
-        self.end_date.setDisplayFormat("MM/dd/yyyy")
+        self.end_date.setDate(today)
+        self.end_date.setDisplayFormat(QDATE_FORMAT)
         end_layout.addWidget(self.end_date)
         date_layout.addLayout(end_layout)
 
@@ -1555,6 +1875,12 @@ class DocuShuttleWindow(QMainWindow):
 
         files_layout.addWidget(self.files_table)
 
+        # Forwarded rows are collected and added together, at most every 100ms
+        self.subject_buffer = []
+        self.subject_flush_timer = QTimer(self)
+        self.subject_flush_timer.setSingleShot(True)
+        self.subject_flush_timer.timeout.connect(self.flush_subjects)
+
         search_layout.addWidget(files_group)
 
         # Buttons
@@ -1580,61 +1906,117 @@ class DocuShuttleWindow(QMainWindow):
         btn_layout.addStretch()
         search_layout.addLayout(btn_layout)
 
-        tabs.addTab(search_tab, "  Search  ")
+        return search_tab
 
-        # Log tab
-        log_tab = QWidget()
-        log_layout = QVBoxLayout(log_tab)
+    def _build_log_tab(self):
+        """Build the Log tab; its text view is created the first time the tab is opened."""
+        self.log_tab = QWidget()
+        log_layout = QVBoxLayout(self.log_tab)
         log_layout.setContentsMargins(10, 15, 10, 10)
+        self.log_text = None
+
+        # Log lines are collected and appended together, at most every 100ms
+        self.log_buffer = []
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.timeout.connect(self.flush_log)
+
+        return self.log_tab
+
+    def init_worker(self):
+        """Start the Outlook thread and connect the worker's signals once."""
+        self.worker_thread = OutlookThread(self)
+        self.worker = OutlookWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.run_requested.connect(self.worker.run_task)
+        self.worker.signals.log_message.connect(self.log)
+        self.worker.signals.search_complete.connect(self.on_search_complete)
+        self.worker.signals.display_subject.connect(self.display_subject)
+        self.worker.signals.operation_complete.connect(self.on_forward_complete)
+        self.worker.signals.error.connect(self.on_error)
+        self.worker.signals.task_finished.connect(self.on_task_finished)
+        self.worker_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_worker)
+
+    def start_operation(self, config, operation):
+        """Queue an Outlook operation on the worker thread."""
+        self.worker.cancel_event.clear()
+        self.operation_running = True
+        self.run_requested.emit(config, operation)
+
+    @pyqtSlot()
+    def on_task_finished(self):
+        """Re-enable the controls once the worker is idle."""
+        self.operation_running = False
+        self.set_buttons_enabled(True)
+
+    def stop_worker(self):
+        """Cancel any running operation and wait for the Outlook thread to exit."""
+        self.worker.cancel()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+
+    @pyqtSlot(list)
+    def on_database_loaded(self, emails):
+        """Fill the recipient list and restore saved state once the database is ready."""
+        self.refresh_email_list(emails)
+        # Nothing loaded before the database was ready counts as the current recipient
+        self.last_recipient = None
+        self.load_saved_state()
+        self.set_buttons_enabled(True)
+
+    @pyqtSlot(str)
+    def on_database_error(self, message):
+        """Report a database that could not be initialized."""
+        self.log(f"Database error: {message}")
+        self.set_buttons_enabled(True)
+        QMessageBox.critical(
+            self, "Database Error",
+            f"Failed to initialize the database.\n\nError: {message}\n\n"
+            f"Check error.log in {get_app_data_dir()}"
+        )
 
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        log_layout.addWidget(self.log_text)
-
-        tabs.addTab(log_tab, "  Log  ")
-
-        main_layout.addWidget(content)
-
-        # Initialize database and load emails
-        init_db()
-        self.refresh_email_list()
-
-    def refresh_email_list(self):
-        """Refresh the email combobox."""
-        current = self.recipient_combo.currentText()
-        self.recipient_combo.clear()
-        emails = load_email_addresses()
-        self.recipient_combo.addItems(emails)
-        if current and current in emails:
-            self.recipient_combo.setCurrentText(current)
+    def refresh_email_list(self, emails):
+        """Show the given recipients, as read off the GUI thread, without emitting selection changes."""
+        if emails == self.recipient_model.stringList():
+            return
+        combo = self.recipient_combo
+        current = combo.currentText()
+        # Otherwise every intermediate selection would load and save a recipient's config
+        combo.blockSignals(True)
+        try:
+            self.recipient_model.setStringList(emails)
+            if current and current in emails:
+                combo.setCurrentText(current)
+        finally:
+            combo.blockSignals(False)
 
     def load_saved_state(self):
         """Load saved application state."""
-        last_email = load_setting('last_used_email')
+        settings = load_settings(('last_used_email', 'last_start_date', 'last_end_date', 'auto_update'))
+        last_email = settings.get('last_used_email')
         if last_email:
             idx = self.recipient_combo.findText(last_email)
             if idx >= 0:
+                self.recipient_combo.blockSignals(True)
                 self.recipient_combo.setCurrentIndex(idx)
+                self.recipient_combo.blockSignals(False)
+        # The list was filled with signals blocked, so load the selection's config once here
+        self.apply_recipient_change()
 
-        last_start = load_setting('last_start_date')
-        last_end = load_setting('last_end_date')
+        last_start = settings.get('last_start_date')
+        last_end = settings.get('last_end_date')
         if last_start:
-            try:
-                date = QDate.fromString(last_start, "MM/dd/yyyy")
-                if date.isValid():
-                    self.start_date.setDate(date)
-            except Exception:
-                pass
+            date = parse_stored_date(last_start)
+            if date.isValid():
+                self.start_date.setDate(date)
         if last_end:
-            try:
-                date = QDate.fromString(last_end, "MM/dd/yyyy")
-                if date.isValid():
-                    self.end_date.setDate(date)
-            except Exception:
-                pass
+            date = parse_stored_date(last_end)
+            if date.isValid():
+                self.end_date.setDate(date)
 
         # Load auto-update setting
-        auto_update = load_setting('auto_update')
+        auto_update = settings.get('auto_update')
         if auto_update is not None:
             # Convert string to boolean (SQLite stores as string)
             if isinstance(auto_update, str):
@@ -1642,10 +2024,19 @@ class DocuShuttleWindow(QMainWindow):
             else:
                 self.config_auto_update = bool(auto_update)
 
+    @pyqtSlot(str)
     def on_recipient_changed(self, text):
-        """Handle recipient selection change."""
-        if not text:
+        """Handle recipient selection change by restarting the debounce timer."""
+        self.recipient_timer.start()
+
+    def apply_recipient_change(self):
+        """Save the current recipient as last used and load its configuration."""
+        self.recipient_timer.stop()
+        text = self.recipient_combo.currentText()
+        # Editing back to the same address leaves nothing to save or load
+        if not text or text == self.last_recipient:
             return
+        self.last_recipient = text
 
         save_setting('last_used_email', text)
 
@@ -1654,18 +2045,14 @@ class DocuShuttleWindow(QMainWindow):
             start_date, end_date, prefix, keyword, req_attach, skip_fwd, delay = config
 
             if start_date:
-                converted = convert_date_format(start_date)
-                if converted:
-                    date = QDate.fromString(converted, "MM/dd/yyyy")
-                    if date.isValid():
-                        self.start_date.setDate(date)
+                date = parse_stored_date(start_date)
+                if date.isValid():
+                    self.start_date.setDate(date)
 
             if end_date:
-                converted = convert_date_format(end_date)
-                if converted:
-                    date = QDate.fromString(converted, "MM/dd/yyyy")
-                    if date.isValid():
-                        self.end_date.setDate(date)
+                date = parse_stored_date(end_date)
+                if date.isValid():
+                    self.end_date.setDate(date)
 
             self.config_prefix = prefix or ""
             self.subject_edit.setText(keyword or "BILLING INVOICE")
@@ -1675,22 +2062,58 @@ class DocuShuttleWindow(QMainWindow):
 
             self.log(f"Loaded configuration for '{text}'")
 
+    @pyqtSlot(str)
     def log(self, message):
-        """Add message to log."""
-        timestamp = datetime.datetime.now(pytz.timezone(DEFAULT_TIMEZONE)).strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        """Add message to log; the worker sends several lines in one message."""
+        timestamp = datetime.datetime.now(LOCAL_TZ).strftime(TIMESTAMP_FORMAT)
+        self.log_buffer.extend(f"[{timestamp}] {line}" for line in message.split('\n'))
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start(100)
+
+    def on_tab_changed(self, index):
+        """Create the log view the first time the Log tab is shown."""
+        if self.log_text is None and self.tabs.widget(index) is self.log_tab:
+            # Plain text with a block limit: no rich-text layout, and the
+            # oldest lines are dropped once MAX_LOG_LINES is reached
+            self.log_text = QPlainTextEdit()
+            self.log_text.setReadOnly(True)
+            self.log_text.setMaximumBlockCount(MAX_LOG_LINES)
+            self.log_tab.layout().addWidget(self.log_text)
+            self.flush_log()
+
+    def flush_log(self):
+        """Append buffered log lines to the log view in one update."""
+        if not self.log_buffer:
+            return
+        if self.log_text is None:
+            # Until the log view exists, keep only the lines it would show
+            del self.log_buffer[:-MAX_LOG_LINES]
+            return
+        self.log_text.appendPlainText('\n'.join(self.log_buffer))
+        self.log_buffer.clear()
 
     def show_config_dialog(self):
         """Show configuration dialog."""
         try:
-            dialog = ConfigDialog(
-                self,
-                self.config_prefix,
-                self.config_delay,
-                self.config_require_attachments,
-                self.config_skip_forwarded,
-                self.config_auto_update
-            )
+            dialog = self.config_dialog
+            if dialog is None:
+                dialog = self.config_dialog = ConfigDialog(
+                    self,
+                    self.config_prefix,
+                    self.config_delay,
+                    self.config_require_attachments,
+                    self.config_skip_forwarded,
+                    self.config_auto_update
+                )
+            else:
+                # Discard edits left from a cancelled visit
+                dialog.set_values(
+                    self.config_prefix,
+                    self.config_delay,
+                    self.config_require_attachments,
+                    self.config_skip_forwarded,
+                    self.config_auto_update
+                )
 
             if dialog.exec_() == QDialog.Accepted:
                 values = dialog.get_values()
@@ -1706,15 +2129,7 @@ class DocuShuttleWindow(QMainWindow):
             # Log error and show user-friendly message
             error_msg = f"Failed to open configuration dialog: {str(e)}"
             self.log(error_msg)
-            try:
-                error_log = os.path.join(get_app_data_dir(), 'error.log')
-                with open(error_log, 'a') as f:
-                    import traceback
-                    f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] show_config_dialog error:\n")
-                    f.write(traceback.format_exc())
-                    f.write("\n")
-            except:
-                pass
+            write_error_log("show_config_dialog error:", include_traceback=True)
             QMessageBox.critical(
                 self, "Configuration Error",
                 f"Failed to open configuration dialog.\n\nError: {str(e)}\n\n"
@@ -1723,26 +2138,7 @@ class DocuShuttleWindow(QMainWindow):
 
     def show_email_context_menu(self, position):
         """Show right-click context menu for email combobox."""
-        context_menu = QMenu(self)
-        context_menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {COLORS['frame_bg']};
-                border: 1px solid {COLORS['border']};
-                padding: 5px;
-            }}
-            QMenu::item {{
-                padding: 8px 20px;
-            }}
-            QMenu::item:selected {{
-                background-color: {COLORS['primary']};
-                color: white;
-            }}
-        """)
-
-        delete_action = context_menu.addAction("Delete Email")
-        delete_action.triggered.connect(self.delete_current_config)
-
-        context_menu.exec_(self.recipient_combo.mapToGlobal(position))
+        self.email_context_menu.exec_(self.recipient_combo.mapToGlobal(position))
 
     def delete_current_config(self):
         """Delete current email configuration."""
@@ -1760,13 +2156,28 @@ class DocuShuttleWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             if delete_config(recipient):
                 self.log(f"Deleted configuration for '{recipient}'")
-                self.refresh_email_list()
-                self.recipient_combo.setCurrentText("")
+                # The combobox mirrors the saved recipients, so drop the one entry
+                # instead of re-querying and rebuilding the list
+                combo = self.recipient_combo
+                # Dropping the selected entry and clearing the text are not user selections
+                combo.blockSignals(True)
+                try:
+                    idx = combo.findText(recipient)
+                    if idx >= 0:
+                        combo.removeItem(idx)
+                    combo.setCurrentText("")
+                finally:
+                    combo.blockSignals(False)
+                self.last_recipient = None
             else:
                 QMessageBox.warning(self, "Error", "Failed to delete configuration.")
 
     def validate_inputs(self):
         """Validate form inputs."""
+        # Apply a recipient change still waiting on the timer before it is used
+        if self.recipient_timer.isActive():
+            self.apply_recipient_change()
+
         recipient = self.recipient_combo.currentText().strip()
         if not recipient or not validate_email(recipient):
             QMessageBox.warning(self, "Error", "Please enter a valid email address.")
@@ -1780,12 +2191,17 @@ class DocuShuttleWindow(QMainWindow):
 
     def get_config(self):
         """Get current configuration."""
+        start = self.start_date.date()
+        end = self.end_date.date()
         return {
             'recipient': self.recipient_combo.currentText().strip(),
             'subject_keyword': self.subject_edit.text().strip(),
-            'start_date': self.start_date.date().toString("MM/dd/yyyy"),
-            'end_date': self.end_date.date().toString("MM/dd/yyyy"),
+            'start_date': start.toString(QDATE_FORMAT),
+            'end_date': end.toString(QDATE_FORMAT),
+            # Localized once here so the worker doesn't re-parse the date strings
+            'date_bounds': get_date_bounds(start.toPyDate(), end.toPyDate()),
             'file_number_prefix': self.config_prefix,
+            'file_number_prefixes': parse_file_number_prefixes(self.config_prefix),
             'require_attachments': self.config_require_attachments,
             'skip_forwarded': self.config_skip_forwarded,
             'delay_seconds': self.config_delay
@@ -1807,21 +2223,17 @@ class DocuShuttleWindow(QMainWindow):
         self.set_buttons_enabled(False)
         self.log("Starting email preview...")
 
-        self.worker = OutlookWorker(config, 'search')
-        self.worker.signals.log_message.connect(self.log)
-        self.worker.signals.search_complete.connect(self.on_search_complete)
-        self.worker.signals.error.connect(self.on_error)
-        self.worker.finished.connect(lambda: self.set_buttons_enabled(True))
-        self.worker.start()
+        self.start_operation(config, 'search')
 
-    def on_search_complete(self, scanned, results):
+    @pyqtSlot(int, int, list)
+    def on_search_complete(self, scanned, found, preview):
         """Handle search completion."""
-        msg = f"Found {len(results)} matching emails (scanned {scanned})"
+        msg = f"Found {found} matching emails (scanned {scanned})"
         self.log(msg)
 
-        if results:
-            text = "\n".join(results)
-            QMessageBox.information(self, "Preview Results", f"{msg}\n\n{text[:2000]}...")
+        if found:
+            text = join_limited(preview, SEARCH_PREVIEW_CHARS)
+            QMessageBox.information(self, "Preview Results", f"{msg}\n\n{text}...")
         else:
             QMessageBox.information(self, "Preview Results", "No matching emails found.")
 
@@ -1849,7 +2261,7 @@ class DocuShuttleWindow(QMainWindow):
 
         config = self.get_config()
 
-        # Save configuration
+        # Save configuration and the last used dates with a single commit
         save_config(
             config['recipient'],
             config['start_date'],
@@ -1858,55 +2270,62 @@ class DocuShuttleWindow(QMainWindow):
             config['subject_keyword'],
             config['require_attachments'],
             config['skip_forwarded'],
-            float(config['delay_seconds']) if config['delay_seconds'] else 0
+            float(config['delay_seconds']) if config['delay_seconds'] else 0,
+            settings={'last_start_date': config['start_date'], 'last_end_date': config['end_date']}
         )
 
-        save_setting('last_start_date', config['start_date'])
-        save_setting('last_end_date', config['end_date'])
-
-        self.refresh_email_list()
+        # Only this recipient can be new, so add it instead of re-querying and rebuilding the list
+        if self.recipient_combo.findText(config['recipient']) < 0:
+            self.recipient_combo.addItem(config['recipient'])
+        # Reset the table here rather than via a signal round-trip from the worker
+        self.subject_buffer.clear()
+        self.files_table.setRowCount(0)
         self.set_buttons_enabled(False)
         self.log("Starting forward operation...")
 
-        self.worker = OutlookWorker(config, 'forward')
-        self.worker.signals.log_message.connect(self.log)
-        self.worker.signals.display_subject.connect(self.display_subject)
-        self.worker.signals.clear_subjects.connect(lambda: self.files_table.setRowCount(0))
-        self.worker.signals.operation_complete.connect(self.on_forward_complete)
-        self.worker.signals.error.connect(self.on_error)
-        self.worker.finished.connect(lambda: self.set_buttons_enabled(True))
-        self.worker.start()
+        self.start_operation(config, 'forward')
 
+    @pyqtSlot(str, str, str)
     def display_subject(self, subject, recipient, attachments):
-        """Display forwarded email details in table."""
-        # Get current timestamp
-        timestamp = datetime.datetime.now(pytz.timezone(DEFAULT_TIMEZONE)).strftime("%Y-%m-%d %H:%M:%S")
+        """Queue forwarded email details for the table."""
+        timestamp = datetime.datetime.now(LOCAL_TZ).strftime(TIMESTAMP_FORMAT)
+        self.subject_buffer.append((timestamp, subject, recipient, attachments))
+        if not self.subject_flush_timer.isActive():
+            self.subject_flush_timer.start(100)
+
+    def flush_subjects(self):
+        """Add queued forwarded email rows to the table in one update."""
+        self.subject_flush_timer.stop()
+        if not self.subject_buffer:
+            return
 
-        # Disable sorting while adding row
+        # Disable sorting while adding rows
         self.files_table.setSortingEnabled(False)
 
-        # Add new row
-        row_position = self.files_table.rowCount()
-        self.files_table.insertRow(row_position)
-
-        # Add data to columns
-        self.files_table.setItem(row_position, 0, QTableWidgetItem(timestamp))
-        self.files_table.setItem(row_position, 1, QTableWidgetItem(subject))
-        self.files_table.setItem(row_position, 2, QTableWidgetItem(recipient))
-        self.files_table.setItem(row_position, 3, QTableWidgetItem(attachments))
+        first_row = self.files_table.rowCount()
+        self.files_table.setRowCount(first_row + len(self.subject_buffer))
+        for row_position, values in enumerate(self.subject_buffer, first_row):
+            for column, value in enumerate(values):
+                self.files_table.setItem(row_position, column, QTableWidgetItem(value))
+        # Held before sorting resumes and possibly moves the row
+        last_item = self.files_table.item(row_position, 0)
+        self.subject_buffer.clear()
 
         # Re-enable sorting
         self.files_table.setSortingEnabled(True)
 
-        # Scroll to the new row
-        self.files_table.scrollToItem(self.files_table.item(row_position, 0))
+        # Scroll to the newest row
+        self.files_table.scrollToItem(last_item)
 
+    @pyqtSlot(int, int)
     def on_forward_complete(self, scanned, forwarded):
         """Handle forward completion."""
+        self.flush_subjects()
         msg = f"Scanned {scanned} emails, forwarded {forwarded} emails."
         self.log(msg)
         QMessageBox.information(self, "Complete", msg)
 
+    @pyqtSlot(str)
     def on_error(self, error_msg):
         """Handle worker error."""
         self.log(f"Error: {error_msg}")
@@ -1914,7 +2333,7 @@ class DocuShuttleWindow(QMainWindow):
 
     def cancel_operation(self):
         """Cancel current operation."""
-        if self.worker and self.worker.isRunning():
+        if self.operation_running:
             self.worker.cancel()
             self.log("Cancellation requested...")
 
@@ -2158,16 +2577,83 @@ class AnimatedSplashScreen(QWidget):
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.setAutoFillBackground(False)
 
-        # Animation timer
+        # Corner accents never move, so each color's lines are built once and drawn in one call
+        w, h = self.splash_width, self.splash_height
+        self._teal_corner_lines = [
+            QLineF(15, 12, 40, 12), QLineF(12, 15, 12, 40),
+            QLineF(w - 40, 12, w - 15, 12), QLineF(w - 12, 15, w - 12, 40),
+        ]
+        self._purple_corner_lines = [
+            QLineF(15, h - 12, 40, h - 12), QLineF(12, h - 40, 12, h - 15),
+            QLineF(w - 40, h - 12, w - 15, h - 12), QLineF(w - 12, h - 40, w - 12, h - 15),
+        ]
+
+        # Gradients and shapes that don't change between frames
+        self._background_gradient = QLinearGradient(0, 0, w, h)
+        self._background_gradient.setColorAt(0, QColor(15, 23, 42))
+        self._background_gradient.setColorAt(0.5, QColor(30, 41, 59))
+        self._background_gradient.setColorAt(1, QColor(15, 23, 42))
+
+        self._top_glow_gradient = QLinearGradient(0, 0, 0, 140)
+        self._top_glow_gradient.setColorAt(0, QColor(93, 154, 150, 30))  # Muted teal
+        self._top_glow_gradient.setColorAt(1, QColor(93, 154, 150, 0))
+
+        self._emblem_glow_gradient = QRadialGradient(0, 0, 45)
+        self._emblem_glow_gradient.setColorAt(0, QColor(93, 154, 150, 60))  # Teal
+        self._emblem_glow_gradient.setColorAt(0.6, QColor(147, 112, 162, 30))  # Purple
+        self._emblem_glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
+
+        self._emblem_gradient = QRadialGradient(0, -8, 32)
+        self._emblem_gradient.setColorAt(0, QColor(51, 65, 85))
+        self._emblem_gradient.setColorAt(1, QColor(30, 41, 59))
+
+        # Envelope flap (triangle) over a 16x11 envelope body
+        env_w, env_h = 16, 11
+        self._envelope_flap_path = QPainterPath()
+        self._envelope_flap_path.moveTo(-env_w/2, -env_h/2 + 1)
+        self._envelope_flap_path.lineTo(0, 3)
+        self._envelope_flap_path.lineTo(env_w/2, -env_h/2 + 1)
+        self._envelope_flap_path.closeSubpath()
+
+        # Fonts and fixed pens, created once instead of on every paint
+        self._title_font = QFont("Segoe UI", 36, QFont.Light)
+        self._title_font.setLetterSpacing(QFont.AbsoluteSpacing, 2)
+        self._tagline_font = QFont("Segoe UI", 10)
+        self._tagline_font.setLetterSpacing(QFont.AbsoluteSpacing, 2)
+        self._status_font = QFont("Segoe UI", 10)
+        self._percent_font = QFont("Segoe UI", 9)
+        self._version_font = QFont("Segoe UI", 8)
+
+        self._border_pen = QPen(QColor(93, 154, 150, 120))  # Muted teal
+        self._border_pen.setWidth(2)
+        self._emblem_pen = QPen(QColor(71, 85, 105))
+        self._emblem_pen.setWidth(2)
+        self._pulse_pen = QPen(QColor(93, 154, 150, 180))  # Teal
+        self._pulse_pen.setWidth(2)
+
+        # Fixed colors, built once instead of per frame
+        self._envelope_color = QColor(226, 232, 240)
+        self._envelope_flap_color = QColor(200, 210, 220)
+        self._percent_color = QColor(100, 116, 139)
+        # Progress fill stops (teal, light teal, purple, teal); the gradient itself moves
+        self._progress_fill_stops = [
+            (0, QColor(93, 154, 150)), (0.33, QColor(127, 179, 175)),
+            (0.66, QColor(147, 112, 162)), (1, QColor(93, 154, 150)),
+        ]
+        self._progress_layers = None  # Rounded track, fill mask and shine pixmaps, rendered on first paint
+        self._title_widths = None  # Title text widths, measured on first paint
+        self._background = None  # Static background layer, rendered on first paint
+
+        # After the intro only the rings/emblem and the progress area still change
+        self._intro_painted = False  # Whether a full frame has been painted at full intro
+        self._emblem_rect = QRect(w // 2 - 56, 100 - 56, 112, 112)
+        self._progress_rect = QRect(0, 246, w, 46)
+
+        # Animation timer; it also advances the progress target, so there is one wakeup per frame
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._animate)
         self.timer.start(16)  # ~60 FPS
 
-        # Progress timer
-        self.progress_timer = QTimer(self)
-        self.progress_timer.timeout.connect(self._update_progress)
-        self.progress_timer.start(50)
-
         # Center on screen
         screen = QApplication.primaryScreen().geometry()
         self.move(
@@ -2194,6 +2680,8 @@ class AnimatedSplashScreen(QWidget):
         else:
             self.intro_progress = 1.0
 
+        self._update_progress(elapsed)
+
         # Continuous animations
         self.ring_rotation = elapsed * 30
         self.pulse_phase = elapsed * 2.5
@@ -2206,12 +2694,18 @@ class AnimatedSplashScreen(QWidget):
         else:
             self.progress += diff * 0.15
 
-        self.update()
+        if not self._intro_painted or self.is_fading:
+            self.update()
+            self._intro_painted = self.intro_progress >= 1.0
+        else:
+            self.update(self._emblem_rect)
+            self.update(self._progress_rect)
 
-    def _update_progress(self):
-        """Update progress bar."""
+    def _update_progress(self, elapsed):
+        """Update the progress target and message from the elapsed time."""
         if self._target_progress < 100:
-            self._target_progress += 2
+            # Two percent per 50ms, reaching 100% after 2.5 seconds
+            self._target_progress = min(100, 2 * int(elapsed * 20))
             # Update messages based on progress
             if self._target_progress < 20:
                 self._message = "Initializing..."
@@ -2225,7 +2719,6 @@ class AnimatedSplashScreen(QWidget):
                 self._message = "Almost ready..."
         else:
             self._message = "Ready!"
-            self.progress_timer.stop()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -2237,10 +2730,11 @@ class AnimatedSplashScreen(QWidget):
         if self.is_fading:
             painter.setOpacity(self.fade_opacity)
 
-        # Draw solid background
-        painter.fillRect(self.rect(), QColor(15, 23, 42))
+        # The background never changes, so it is rendered once and blitted
+        if self._background is None:
+            self._background = self._render_background()
+        painter.drawPixmap(0, 0, self._background)
 
-        self._draw_background(painter)
         self._draw_orbital_rings(painter)
         self._draw_center_emblem(painter)
         self._draw_title(painter)
@@ -2250,33 +2744,36 @@ class AnimatedSplashScreen(QWidget):
 
         painter.end()
 
+    def _render_background(self):
+        """Render the static background layer into a pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        # Draw solid background
+        painter.fillRect(self.rect(), QColor(15, 23, 42))
+        self._draw_background(painter)
+        painter.end()
+        return pixmap
+
     def _draw_background(self, painter):
         """Draw premium gradient background."""
         painter.save()
 
         # Rich gradient background
-        bg = QLinearGradient(0, 0, self.width(), self.height())
-        bg.setColorAt(0, QColor(15, 23, 42))
-        bg.setColorAt(0.5, QColor(30, 41, 59))
-        bg.setColorAt(1, QColor(15, 23, 42))
-
-        painter.setBrush(bg)
+        painter.setBrush(self._background_gradient)
         painter.setPen(Qt.NoPen)
         painter.drawRect(self.rect())
 
         # Subtle top glow (teal for DocuShuttle)
         glow_rect = QRectF(0, 0, self.width(), 140)
-        glow = QLinearGradient(0, 0, 0, 140)
-        glow.setColorAt(0, QColor(93, 154, 150, 30))  # Muted teal
-        glow.setColorAt(1, QColor(93, 154, 150, 0))
-        painter.setBrush(glow)
+        painter.setBrush(self._top_glow_gradient)
         painter.drawRect(glow_rect)
 
         # Border
         painter.setBrush(Qt.NoBrush)
-        border_pen = QPen(QColor(93, 154, 150, 120))  # Muted teal
-        border_pen.setWidth(2)
-        painter.setPen(border_pen)
+        painter.setPen(self._border_pen)
         painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
 
         painter.restore()
@@ -2331,51 +2828,32 @@ class AnimatedSplashScreen(QWidget):
         painter.scale(scale, scale)
 
         # Outer glow circle
-        glow = QRadialGradient(0, 0, 45)
-        glow.setColorAt(0, QColor(93, 154, 150, 60))  # Teal
-        glow.setColorAt(0.6, QColor(147, 112, 162, 30))  # Purple
-        glow.setColorAt(1, QColor(0, 0, 0, 0))
-        painter.setBrush(glow)
+        painter.setBrush(self._emblem_glow_gradient)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(QPointF(0, 0), 45, 45)
 
         # Main emblem circle
-        emblem_bg = QRadialGradient(0, -8, 32)
-        emblem_bg.setColorAt(0, QColor(51, 65, 85))
-        emblem_bg.setColorAt(1, QColor(30, 41, 59))
-
-        painter.setBrush(emblem_bg)
-        pen = QPen(QColor(71, 85, 105))
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setBrush(self._emblem_gradient)
+        painter.setPen(self._emblem_pen)
         painter.drawEllipse(QPointF(0, 0), 28, 28)
 
         # Pulsing inner ring
         pulse = 0.85 + 0.15 * math.sin(self.pulse_phase)
-        pen = QPen(QColor(93, 154, 150, 180))  # Teal
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._pulse_pen)
         painter.setBrush(Qt.NoBrush)
         painter.drawEllipse(QPointF(0, 0), 20 * pulse, 20 * pulse)
 
         # Draw envelope icon
         painter.setPen(Qt.NoPen)
-        envelope_color = QColor(226, 232, 240)
-        painter.setBrush(envelope_color)
+        painter.setBrush(self._envelope_color)
 
         # Envelope body
         env_w, env_h = 16, 11
         painter.drawRect(int(-env_w/2), int(-env_h/2 + 1), env_w, env_h)
 
         # Envelope flap (triangle)
-        flap_path = QPainterPath()
-        flap_path.moveTo(-env_w/2, -env_h/2 + 1)
-        flap_path.lineTo(0, 3)
-        flap_path.lineTo(env_w/2, -env_h/2 + 1)
-        flap_path.closeSubpath()
-
-        painter.setBrush(QColor(200, 210, 220))
-        painter.drawPath(flap_path)
+        painter.setBrush(self._envelope_flap_color)
+        painter.drawPath(self._envelope_flap_path)
 
         painter.restore()
 
@@ -2386,9 +2864,7 @@ class AnimatedSplashScreen(QWidget):
         opacity = max(0, (self.intro_progress - 0.2) / 0.8) if self.intro_progress > 0.2 else 0
 
         # Title font
-        font = QFont("Segoe UI", 36, QFont.Light)
-        font.setLetterSpacing(QFont.AbsoluteSpacing, 2)
-        painter.setFont(font)
+        painter.setFont(self._title_font)
 
         title_rect = QRectF(0, 155, self.width(), 50)
 
@@ -2396,16 +2872,17 @@ class AnimatedSplashScreen(QWidget):
         painter.setPen(QColor(0, 0, 0, int(100 * opacity)))
         painter.drawText(title_rect.adjusted(2, 2, 2, 2), Qt.AlignCenter, "DocuShuttle")
 
-        # Draw "Docu" in teal
-        metrics = painter.fontMetrics()
-        full_width = metrics.horizontalAdvance("DocuShuttle")
+        # Draw "Docu" in teal; the text never changes, so it is measured once
+        if self._title_widths is None:
+            metrics = painter.fontMetrics()
+            self._title_widths = (metrics.horizontalAdvance("DocuShuttle"), metrics.horizontalAdvance("Docu"))
+        full_width, docu_width = self._title_widths
         start_x = (self.width() - full_width) / 2
 
         painter.setPen(QColor(93, 154, 150, int(255 * opacity)))  # Teal
         painter.drawText(int(start_x), 195, "Docu")
 
         # Draw "Shuttle" in purple
-        docu_width = metrics.horizontalAdvance("Docu")
         painter.setPen(QColor(147, 112, 162, int(255 * opacity)))  # Purple
         painter.drawText(int(start_x + docu_width), 195, "Shuttle")
 
@@ -2417,9 +2894,7 @@ class AnimatedSplashScreen(QWidget):
 
         opacity = max(0, (self.intro_progress - 0.4) / 0.6) if self.intro_progress > 0.4 else 0
 
-        font = QFont("Segoe UI", 10)
-        font.setLetterSpacing(QFont.AbsoluteSpacing, 2)
-        painter.setFont(font)
+        painter.setFont(self._tagline_font)
         painter.setPen(QColor(148, 163, 184, int(255 * opacity)))
 
         painter.drawText(QRectF(0, 205, self.width(), 25), Qt.AlignCenter,
@@ -2434,8 +2909,7 @@ class AnimatedSplashScreen(QWidget):
         opacity = max(0, (self.intro_progress - 0.5) / 0.5) if self.intro_progress > 0.5 else 0
 
         # Status message
-        font = QFont("Segoe UI", 10)
-        painter.setFont(font)
+        painter.setFont(self._status_font)
         painter.setPen(QColor(148, 163, 184, int(255 * opacity)))
         painter.drawText(QRectF(0, 248, self.width(), 20), Qt.AlignCenter, self._message)
 
@@ -2445,75 +2919,87 @@ class AnimatedSplashScreen(QWidget):
         bar_x = (self.width() - bar_width) / 2
         bar_y = 278
 
+        # The rounded shapes are rasterized once; each frame only blits them
+        if self._progress_layers is None:
+            self._progress_layers = self._render_progress_layers(bar_width, bar_height)
+        track, fill, shine = self._progress_layers
+        bar_pos = QPointF(bar_x, bar_y)
+
         # Track background
-        painter.setBrush(QColor(51, 65, 85, int(255 * opacity)))
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(QRectF(bar_x, bar_y, bar_width, bar_height), 2, 2)
+        base_opacity = painter.opacity()
+        painter.setOpacity(base_opacity * opacity)
+        painter.drawPixmap(bar_pos, track)
 
         # Progress fill
         if self.progress > 0.5:
             fill_width = (self.progress / 100) * bar_width
 
-            # Animated gradient (teal to purple)
+            # Animated gradient (teal to purple), painted into the rounded mask
             offset = self.wave_offset % (bar_width * 2)
-            fill_grad = QLinearGradient(bar_x - offset, 0, bar_x + bar_width * 2 - offset, 0)
-            fill_grad.setColorAt(0, QColor(93, 154, 150))   # Teal
-            fill_grad.setColorAt(0.33, QColor(127, 179, 175))  # Light teal
-            fill_grad.setColorAt(0.66, QColor(147, 112, 162))  # Purple
-            fill_grad.setColorAt(1, QColor(93, 154, 150))   # Teal
-
-            # Clip and draw
+            fill_grad = QLinearGradient(-offset, 0, bar_width * 2 - offset, 0)
+            fill_grad.setStops(self._progress_fill_stops)
+            fill_painter = QPainter(fill)
+            fill_painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+            fill_painter.fillRect(0, 0, bar_width, bar_height, fill_grad)
+            fill_painter.end()
+
+            # Clip and draw, with the shine over the same filled part
             painter.setClipRect(QRectF(bar_x, bar_y, fill_width, bar_height))
-            painter.setBrush(fill_grad)
-            painter.setOpacity(opacity)
-            painter.drawRoundedRect(QRectF(bar_x, bar_y, bar_width, bar_height), 2, 2)
-            painter.setClipping(False)
-
-            # Top shine
-            shine = QLinearGradient(0, bar_y, 0, bar_y + bar_height)
-            shine.setColorAt(0, QColor(255, 255, 255, 70))
-            shine.setColorAt(0.5, QColor(255, 255, 255, 0))
-            painter.setClipRect(QRectF(bar_x, bar_y, fill_width, bar_height / 2))
-            painter.setBrush(shine)
-            painter.drawRoundedRect(QRectF(bar_x, bar_y, bar_width, bar_height), 2, 2)
+            painter.drawPixmap(bar_pos, fill)
+            painter.drawPixmap(bar_pos, shine)
             painter.setClipping(False)
 
         # Percentage text
-        painter.setOpacity(opacity)
-        pct_font = QFont("Segoe UI", 9)
-        painter.setFont(pct_font)
-        painter.setPen(QColor(100, 116, 139))
+        painter.setOpacity(base_opacity * opacity)
+        painter.setFont(self._percent_font)
+        painter.setPen(self._percent_color)
         painter.drawText(QRectF(bar_x + bar_width + 12, bar_y - 3, 50, 14),
                         Qt.AlignLeft | Qt.AlignVCenter, f"{int(self.progress)}%")
 
         painter.restore()
 
+    def _render_progress_layers(self, bar_width, bar_height):
+        """Render the progress track, fill mask and top shine into bar-sized pixmaps."""
+        ratio = self.devicePixelRatioF()
+        bar_rect = QRectF(0, 0, bar_width, bar_height)
+        layers = []
+        for brush, clip_height in ((QColor(51, 65, 85), bar_height),
+                                   (QColor(93, 154, 150), bar_height),
+                                   (None, bar_height / 2)):
+            pixmap = QPixmap(int(bar_width * ratio), int(bar_height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            if brush is None:
+                # Top shine: white fading out over the upper half of the bar
+                brush = QLinearGradient(0, 0, 0, bar_height)
+                brush.setColorAt(0, QColor(255, 255, 255, 70))
+                brush.setColorAt(0.5, QColor(255, 255, 255, 0))
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.setClipRect(QRectF(0, 0, bar_width, clip_height))
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(brush)
+            painter.drawRoundedRect(bar_rect, 2, 2)
+            painter.end()
+            layers.append(pixmap)
+        return layers
+
     def _draw_corner_accents(self, painter):
         """Draw corner accent decorations."""
         painter.save()
 
         opacity = self.intro_progress * 0.25
 
-        # Top left - teal
+        # Top corners - teal
         pen = QPen(QColor(93, 154, 150, int(255 * opacity)))
         pen.setWidth(2)
         painter.setPen(pen)
-        painter.drawLine(15, 12, 40, 12)
-        painter.drawLine(12, 15, 12, 40)
+        painter.drawLines(self._teal_corner_lines)
 
-        # Top right - teal
-        painter.drawLine(self.width() - 40, 12, self.width() - 15, 12)
-        painter.drawLine(self.width() - 12, 15, self.width() - 12, 40)
-
-        # Bottom left - purple
+        # Bottom corners - purple
         pen.setColor(QColor(147, 112, 162, int(255 * opacity)))
         painter.setPen(pen)
-        painter.drawLine(15, self.height() - 12, 40, self.height() - 12)
-        painter.drawLine(12, self.height() - 40, 12, self.height() - 15)
-
-        # Bottom right - purple
-        painter.drawLine(self.width() - 40, self.height() - 12, self.width() - 15, self.height() - 12)
-        painter.drawLine(self.width() - 12, self.height() - 40, self.width() - 12, self.height() - 15)
+        painter.drawLines(self._purple_corner_lines)
 
         painter.restore()
 
@@ -2521,8 +3007,7 @@ class AnimatedSplashScreen(QWidget):
         painter.save()
         opacity = max(0, (self.intro_progress - 0.6) / 0.4) if self.intro_progress > 0.6 else 0
 
-        font = QFont("Segoe UI", 8)
-        painter.setFont(font)
+        painter.setFont(self._version_font)
         painter.setPen(QColor(100, 116, 139, int(180 * opacity)))
         painter.drawText(QRectF(0, 308, self.width(), 20), Qt.AlignCenter, f"v{APP_VERSION}")
         painter.restore()
@@ -2531,7 +3016,6 @@ class AnimatedSplashScreen(QWidget):
         """Finish the splash and show main window."""
         self.is_fading = True
         self.timer.stop()
-        self.progress_timer.stop()
         window.show()
         self.close()
 
@@ -2543,6 +3027,8 @@ def main():
     """Application entry point."""
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
+    # Set once for the whole application; windows and dialogs all inherit it
+    app.setStyleSheet(build_stylesheet())
 
     # Show animated splash screen
     splash = AnimatedSplashScreen()